@@ -17,7 +17,10 @@ from .const import (
     CONF_PORT,
     CONF_UPDATE_INTERVAL,
     CONF_API_KEY,
+    FILTER_OPTIONS,
+    OPTION_DEFAULTS,
 )
+from .barcode_cache import async_remove_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,12 +100,41 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Clean up when a config entry is removed.
+
+    Deletes the persisted barcode lookup cache for this entry.
+    """
+    await async_remove_store(hass, entry.entry_id)
+    _LOGGER.info("Removed barcode cache for Pantry Tracker entry %s.", entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """
     Reload Pantry Tracker config entry when options change.
 
     This ensures the sensor code re-reads the updated port/URL or other options.
+    If only the entity filters changed, they are re-applied in place instead.
     """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    refilter = entry_data.get("refilter")
+    previous_options = entry_data.get("options")
+    if refilter and previous_options is not None:
+        # Options fall back to entry data or their defaults, so compare the effective values
+        def effective(options, key):
+            return options.get(key, entry.data.get(key, OPTION_DEFAULTS.get(key)))
+
+        changed = {
+            key for key in set(previous_options) | set(entry.options)
+            if effective(previous_options, key) != effective(entry.options, key)
+        }
+        if changed and changed <= set(FILTER_OPTIONS):
+            _LOGGER.info("Entity filters changed; re-applying without reload.")
+            entry_data["options"] = dict(entry.options)
+            await refilter()
+            return
+
     _LOGGER.info("Reloading Pantry Tracker config entry: %s", entry.entry_id)
     await hass.config_entries.async_reload(entry.entry_id)
 
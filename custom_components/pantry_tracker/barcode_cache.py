@@ -0,0 +1,178 @@
+# custom_components/pantry_tracker/barcode_cache.py
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    BARCODE_CACHE_MAX_ENTRIES,
+    BARCODE_CACHE_TTL,
+    BARCODE_CACHE_NEGATIVE_TTL,
+)
+from .codec import read_response, request_headers
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+
+class BarcodeLookupError(Exception):
+    """The lookup failed for a transient reason and must not be cached."""
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.barcode_cache.{entry_id}"
+
+
+async def fetch_product_from_api(session, source, barcode: str, stats: dict):
+    """
+    Look a barcode up through the add-on.
+
+    Returns the product dict, or None only if the body positively says the
+    barcode is unknown (status 'not_found' or found=false, with a 200 or 404).
+    Raises BarcodeLookupError for anything else that isn't a product, including
+    a bare 404 from a missing route or proxy, so those are retried rather than
+    cached.
+    """
+    try:
+        async with session.get(
+            f"{source}/fetch_product",
+            params={"barcode": barcode},
+            headers=request_headers()
+        ) as resp:
+            status = resp.status
+            if status not in (200, 404):
+                raise BarcodeLookupError(f"Status Code={status}")
+            try:
+                data = await read_response(resp, "fetch_product", stats)
+            except Exception:
+                if status == 404:
+                    raise BarcodeLookupError("Status Code=404") from None
+                raise
+    except BarcodeLookupError:
+        raise
+    except Exception as e:
+        raise BarcodeLookupError(str(e)) from e
+
+    if isinstance(data, dict) and (data.get("status") == "not_found" or data.get("found") is False):
+        return None
+    if status == 404:
+        raise BarcodeLookupError(f"Status Code=404: {data!r}")
+    if not isinstance(data, dict) or not data:
+        raise BarcodeLookupError(f"Unexpected response: {data!r}")
+    if data.get("status") == "error":
+        raise BarcodeLookupError(data.get("message") or "Add-on reported an error")
+    return data
+
+
+async def async_remove_store(hass: HomeAssistant, entry_id: str):
+    """Delete the persisted cache of a removed config entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
+
+
+class BarcodeLookupCache:
+    """
+    Persistent LRU + TTL cache in front of barcode lookups.
+
+    Unknown barcodes are cached too (with a shorter TTL) so repeated scans of
+    an unknown item don't keep hitting the external database. Concurrent
+    lookups for the same barcode share one upstream request. Entries are kept
+    in a Store and saved lazily; any object with the same async_load and
+    async_delay_save methods can be passed in instead, as the tests do.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, fetcher, store=None):
+        self._fetcher = fetcher
+        self._store = store or Store(hass, STORAGE_VERSION, _storage_key(entry_id))
+        self._entries = OrderedDict()  # barcode -> {"product", "expires"}, least recently used first
+        self._inflight = {}
+        self.stats = {
+            "lookups": 0,
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "hit_total_ms": 0.0,
+            "miss_total_ms": 0.0,
+        }
+
+    async def async_load(self):
+        """Restore unexpired entries from storage."""
+        data = await self._store.async_load() or {}
+        now = time.time()
+        for barcode, entry in data.get("entries", []):
+            if entry.get("expires", 0) > now:
+                self._entries[barcode] = entry
+        _LOGGER.debug("Restored %d cached barcode lookups.", len(self._entries))
+
+    def _data_to_save(self) -> dict:
+        return {"entries": list(self._entries.items())}
+
+    @property
+    def hit_rate(self):
+        lookups = self.stats["lookups"]
+        if not lookups:
+            return None
+        return round(100 * (self.stats["hits"] + self.stats["negative_hits"]) / lookups, 1)
+
+    def summary(self) -> dict:
+        """Stats suitable for state attributes."""
+        hits = self.stats["hits"] + self.stats["negative_hits"]
+        misses = self.stats["misses"]
+        return {
+            "entries": len(self._entries),
+            "lookups": self.stats["lookups"],
+            "hits": self.stats["hits"],
+            "negative_hits": self.stats["negative_hits"],
+            "misses": misses,
+            "coalesced": self.stats["coalesced"],
+            "errors": self.stats["errors"],
+            "avg_hit_ms": round(self.stats["hit_total_ms"] / hits, 2) if hits else None,
+            "avg_miss_ms": round(self.stats["miss_total_ms"] / misses, 2) if misses else None,
+        }
+
+    async def async_lookup(self, barcode: str):
+        """Return (product or None, cached) for a barcode."""
+        start = time.perf_counter()
+        self.stats["lookups"] += 1
+
+        entry = self._entries.get(barcode)
+        if entry is not None and entry["expires"] > time.time():
+            self._entries.move_to_end(barcode)
+            self.stats["hits" if entry["product"] is not None else "negative_hits"] += 1
+            self.stats["hit_total_ms"] += (time.perf_counter() - start) * 1000
+            return entry["product"], True
+
+        task = self._inflight.get(barcode)
+        if task is None:
+            task = asyncio.ensure_future(self._async_fetch(barcode))
+            self._inflight[barcode] = task
+            task.add_done_callback(lambda _: self._inflight.pop(barcode, None))
+        else:
+            self.stats["coalesced"] += 1
+
+        try:
+            product = await asyncio.shield(task)
+        except BarcodeLookupError:
+            self.stats["errors"] += 1
+            raise
+        self.stats["misses"] += 1
+        self.stats["miss_total_ms"] += (time.perf_counter() - start) * 1000
+        return product, False
+
+    async def _async_fetch(self, barcode: str):
+        product = await self._fetcher(barcode)
+        ttl = BARCODE_CACHE_TTL if product is not None else BARCODE_CACHE_NEGATIVE_TTL
+        self._entries[barcode] = {"product": product, "expires": time.time() + ttl.total_seconds()}
+        self._entries.move_to_end(barcode)
+        while len(self._entries) > BARCODE_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return product
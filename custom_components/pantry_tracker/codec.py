@@ -0,0 +1,103 @@
+# custom_components/pantry_tracker/codec.py
+
+import json
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Optional faster JSON decoder (orjson ships with Home Assistant core)
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    JSON_DECODER = "orjson"
+except ImportError:  # pragma: no cover - depends on the environment
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    JSON_DECODER = "json"
+
+# Optional compact binary format, only requested when it can be decoded
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+
+ACCEPT = (
+    "application/msgpack, application/json;q=0.9"
+    if msgpack is not None else "application/json"
+)
+
+
+def request_headers() -> dict:
+    """
+    Headers that negotiate the response format with the add-on.
+
+    Only send these on requests whose response goes through read_response.
+    Compression needs no header here: aiohttp already sends
+    'Accept-Encoding: gzip, deflate' (plus 'br' when brotli is installed).
+    """
+    return {"Accept": ACCEPT}
+
+
+def decode_body(body: bytes, content_type: str):
+    """Decode a response body using MessagePack or the fastest available JSON decoder."""
+    if msgpack is not None and content_type in MSGPACK_CONTENT_TYPES:
+        return msgpack.unpackb(body, raw=False)
+    return _json_loads(body)
+
+
+async def read_response(resp, endpoint: str, stats: dict):
+    """
+    Read and decode an aiohttp response, recording transport stats per endpoint.
+
+    Bytes on the wire come from Content-Length (the compressed size when the
+    add-on compresses); aiohttp decompresses transparently, so the decoded
+    size is the length of the body we get back. A compressed response without
+    Content-Length has an unknown wire size and is recorded as None.
+    """
+    body = await resp.read()
+    start = time.perf_counter()
+    data = decode_body(body, resp.content_type)
+    decode_ms = (time.perf_counter() - start) * 1000
+
+    encoding = resp.headers.get("Content-Encoding", "identity")
+    if resp.content_length is not None:
+        wire_bytes = resp.content_length
+    elif encoding == "identity":
+        wire_bytes = len(body)
+    else:
+        wire_bytes = None
+
+    endpoint_stats = stats.setdefault(endpoint, {
+        "requests": 0,
+        "wire_bytes": 0,
+        "wire_bytes_unknown": 0,
+        "decoded_bytes": 0,
+        "decode_ms": 0.0,
+    })
+    endpoint_stats["requests"] += 1
+    if wire_bytes is None:
+        endpoint_stats["wire_bytes_unknown"] += 1
+    else:
+        endpoint_stats["wire_bytes"] += wire_bytes
+    endpoint_stats["decoded_bytes"] += len(body)
+    endpoint_stats["decode_ms"] += decode_ms
+    endpoint_stats["last_wire_bytes"] = wire_bytes
+    endpoint_stats["last_decoded_bytes"] = len(body)
+    endpoint_stats["last_decode_ms"] = round(decode_ms, 3)
+    endpoint_stats["last_encoding"] = encoding
+    endpoint_stats["last_format"] = resp.content_type
+
+    _LOGGER.debug(
+        "Fetched %s: %s bytes on wire (%s), %d bytes decoded with %s in %.2f ms",
+        endpoint, "unknown" if wire_bytes is None else wire_bytes, encoding, len(body),
+        "msgpack" if resp.content_type in MSGPACK_CONTENT_TYPES else JSON_DECODER,
+        decode_ms,
+    )
+    return data
@@ -0,0 +1,86 @@
+# custom_components/pantry_tracker/command_queue.py
+
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProductCommandQueue:
+    """
+    Serialise count commands per product while letting different products run in parallel.
+
+    Each product gets its own FIFO asyncio.Lock, so commands for one product are
+    applied in the order they were issued. Every finished command bumps that
+    product's version; a poll takes a snapshot of the versions before fetching
+    and `is_stale` tells reconciliation to leave a product alone if a command
+    was in flight or completed while the poll was running.
+    """
+
+    def __init__(self):
+        self._locks = {}
+        self._pending = {}
+        self._versions = {}
+        self.stats = {
+            "commands": 0,
+            "failed": 0,
+            "max_depth": 0,
+            "total_wait_ms": 0.0,
+            "total_run_ms": 0.0,
+            "skipped_stale_counts": 0,
+        }
+
+    async def run(self, key: str, command):
+        """Run `command` (a coroutine function) once all earlier commands for `key` are done."""
+        depth = self._pending.get(key, 0) + 1
+        self._pending[key] = depth
+        self.stats["max_depth"] = max(self.stats["max_depth"], depth)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        queued_at = time.perf_counter()
+        try:
+            async with lock:
+                started_at = time.perf_counter()
+                self.stats["total_wait_ms"] += (started_at - queued_at) * 1000
+                try:
+                    return await command()
+                except Exception:
+                    self.stats["failed"] += 1
+                    raise
+                finally:
+                    self.stats["total_run_ms"] += (time.perf_counter() - started_at) * 1000
+        finally:
+            self.stats["commands"] += 1
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._pending[key] -= 1
+            if not self._pending[key]:
+                # Nobody else is waiting on this product; drop its lock
+                del self._pending[key]
+                self._locks.pop(key, None)
+
+    def snapshot(self) -> dict:
+        """Return the current command versions, to be taken before a poll starts."""
+        return dict(self._versions)
+
+    def is_stale(self, key: str, snapshot: dict) -> bool:
+        """Return True if polled data for `key` may predate a local command."""
+        if self._pending.get(key):
+            return True
+        return self._versions.get(key, 0) != snapshot.get(key, 0)
+
+    def log_stats(self):
+        """Log throughput figures, e.g. after a burst of concurrent commands."""
+        commands = self.stats["commands"]
+        if not commands:
+            return
+        _LOGGER.debug(
+            "Command queue: %d commands (%d failed), max depth %d, "
+            "avg wait %.2f ms, avg run %.2f ms, %d stale poll counts skipped",
+            commands,
+            self.stats["failed"],
+            self.stats["max_depth"],
+            self.stats["total_wait_ms"] / commands,
+            self.stats["total_run_ms"] / commands,
+            self.stats["skipped_stale_counts"],
+        )
@@ -13,6 +13,12 @@ from .const import (
     CONF_HOST,
     CONF_PORT,
     CONF_API_KEY,  # Import the new constant
+    CONF_INCLUDE_CATEGORIES,
+    CONF_INCLUDE_TAGS,
+    CONF_INCLUDE_NAMES,
+    CONF_EXPIRY_WARNING_DAYS,
+    FILTER_OPTIONS,
+    OPTION_DEFAULTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,6 +91,9 @@ class PantryTrackerOptionsFlowHandler(config_entries.OptionsFlow):
         config_entry = self.hass.config_entries.async_get_entry(self._entry_id)
 
         if user_input is not None:
+            # An emptied filter box is left out of user_input; store it as cleared
+            for key in FILTER_OPTIONS:
+                user_input.setdefault(key, OPTION_DEFAULTS[key])
             # Save the new options
             return self.async_create_entry(title="", data=user_input)
 
@@ -109,11 +118,43 @@ class PantryTrackerOptionsFlowHandler(config_entries.OptionsFlow):
             current_data.get(CONF_API_KEY, "")
         )
 
+        # Entity filters (comma-separated; empty means every product gets a sensor)
+        include_categories = current_options.get(
+            CONF_INCLUDE_CATEGORIES,
+            OPTION_DEFAULTS[CONF_INCLUDE_CATEGORIES]
+        )
+        include_tags = current_options.get(
+            CONF_INCLUDE_TAGS,
+            OPTION_DEFAULTS[CONF_INCLUDE_TAGS]
+        )
+        include_names = current_options.get(
+            CONF_INCLUDE_NAMES,
+            OPTION_DEFAULTS[CONF_INCLUDE_NAMES]
+        )
+        expiry_warning_days = current_options.get(
+            CONF_EXPIRY_WARNING_DAYS,
+            OPTION_DEFAULTS[CONF_EXPIRY_WARNING_DAYS]
+        )
+
         data_schema = vol.Schema({
             vol.Optional(CONF_UPDATE_INTERVAL, default=update_interval): cv.positive_int,
             vol.Optional(CONF_HOST, default=host): cv.string,
             vol.Optional(CONF_PORT, default=port): cv.port,
             vol.Optional(CONF_API_KEY, default=api_key): cv.string,  # API key in options
+            # Filters use suggested values rather than defaults so they can be cleared
+            vol.Optional(
+                CONF_INCLUDE_CATEGORIES,
+                description={"suggested_value": include_categories}
+            ): cv.string,
+            vol.Optional(
+                CONF_INCLUDE_TAGS,
+                description={"suggested_value": include_tags}
+            ): cv.string,
+            vol.Optional(
+                CONF_INCLUDE_NAMES,
+                description={"suggested_value": include_names}
+            ): cv.string,
+            vol.Optional(CONF_EXPIRY_WARNING_DAYS, default=expiry_warning_days): cv.positive_int,
         })
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
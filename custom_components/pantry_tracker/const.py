@@ -1,9 +1,43 @@
 # custom_components/pantry_tracker/const.py
 
+from datetime import timedelta
+
 DOMAIN = "pantry_tracker"
 
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_API_KEY = "api_key"
-CONF_SOURCE = "source"  # Retained for migration V1 > V2
\ No newline at end of file
+CONF_SOURCE = "source"  # Retained for migration V1 > V2
+
+# Entity filter options (options flow only)
+CONF_INCLUDE_CATEGORIES = "include_categories"
+CONF_INCLUDE_TAGS = "include_tags"
+CONF_INCLUDE_NAMES = "include_names"
+
+# Expiry tracking
+CONF_EXPIRY_WARNING_DAYS = "expiry_warning_days"
+DEFAULT_EXPIRY_WARNING_DAYS = 3
+EVENT_EXPIRING = "pantry_tracker_expiring"
+EVENT_EXPIRED = "pantry_tracker_expired"
+
+# Product image cache
+IMAGE_CACHE_MAX_BYTES = 50 * 1024 * 1024
+IMAGE_MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+IMAGE_THUMBNAIL_SIZE = 256
+
+# Barcode lookup cache
+BARCODE_CACHE_MAX_ENTRIES = 2000
+BARCODE_CACHE_TTL = timedelta(days=30)
+BARCODE_CACHE_NEGATIVE_TTL = timedelta(days=1)
+
+# Options that can be applied without reloading the entry
+FILTER_OPTIONS = (CONF_INCLUDE_CATEGORIES, CONF_INCLUDE_TAGS, CONF_INCLUDE_NAMES)
+
+# Defaults for options that only exist in the options flow (not in entry data)
+OPTION_DEFAULTS = {
+    CONF_INCLUDE_CATEGORIES: "",
+    CONF_INCLUDE_TAGS: "",
+    CONF_INCLUDE_NAMES: "",
+    CONF_EXPIRY_WARNING_DAYS: DEFAULT_EXPIRY_WARNING_DAYS,
+}
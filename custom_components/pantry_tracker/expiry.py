@@ -0,0 +1,210 @@
+# custom_components/pantry_tracker/expiry.py
+
+import heapq
+import itertools
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import EVENT_EXPIRING, EVENT_EXPIRED
+
+_LOGGER = logging.getLogger(__name__)
+
+# Product attributes the add-on may use for expiry, in order of preference
+EXPIRY_ATTRIBUTES = ("expiry_date", "expiration_date", "expiry", "best_before")
+
+STATE_OK = "ok"
+STATE_EXPIRING = "expiring"
+STATE_EXPIRED = "expired"
+
+# Values already reported as unparseable, so polling doesn't repeat the warning
+_UNPARSEABLE = set()
+
+
+def parse_expiry(attributes: dict):
+    """
+    Return the moment a product expires as an aware datetime, or None.
+
+    A plain date means the product is good through that day, so it expires at
+    the start of the following local day. Naive datetimes are taken as local.
+    """
+    for key in EXPIRY_ATTRIBUTES:
+        value = attributes.get(key)
+        if not value:
+            continue
+        value = str(value).strip()
+        try:
+            when = dt_util.parse_datetime(value)
+            if when is not None and "T" not in value and " " not in value:
+                when = None  # Date-only strings are handled below
+        except ValueError:
+            when = None
+        if when is not None:
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+            return dt_util.as_utc(when)
+
+        date = dt_util.parse_date(value)
+        if date is not None:
+            return dt_util.as_utc(dt_util.start_of_local_day(date + timedelta(days=1)))
+
+        if (key, value) not in _UNPARSEABLE:
+            _UNPARSEABLE.add((key, value))
+            _LOGGER.warning("Could not parse %s '%s'", key, value)
+        else:
+            _LOGGER.debug("Could not parse %s '%s'", key, value)
+    return None
+
+
+class ExpiryTracker:
+    """
+    Track product expiry with a min-heap and a single point-in-time timer.
+
+    The heap holds (fire_at, seq, key, state, expiry) transitions. Entries are
+    never removed in place; when a product's expiry changes or the product goes
+    away the old entries are simply skipped when they reach the top, so every
+    update is O(log n). Only the earliest transition has a timer scheduled.
+    """
+
+    def __init__(self, hass: HomeAssistant, warning_window: timedelta):
+        self._hass = hass
+        self._warning_window = warning_window
+        self._heap = []
+        self._seq = itertools.count()
+        self._expiries = {}
+        self._names = {}
+        self._states = {}
+        self._timer_at = None
+        self._timer_unsub = None
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """Register a callback invoked whenever expiry states change; returns a remover."""
+        self._listeners.append(listener)
+
+        def remove_listener():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    def products_in_state(self, state: str) -> list:
+        """Return the names of products currently in the given state."""
+        return sorted(self._names[key] for key, s in self._states.items() if s == state)
+
+    def count(self, state: str) -> int:
+        return sum(1 for s in self._states.values() if s == state)
+
+    @callback
+    def async_update(self, key: str, name: str, expiry):
+        """Add, change or clear the expiry for a product."""
+        if expiry is None:
+            self.async_remove(key)
+            return
+        self._names[key] = name
+        if self._expiries.get(key) == expiry:
+            return
+
+        self._expiries[key] = expiry
+        now = dt_util.utcnow()
+        expiring_at = expiry - self._warning_window
+
+        # Products already inside a window when first seen get their state
+        # directly; events are only fired for transitions the timer observes.
+        if now >= expiry:
+            state = STATE_EXPIRED
+        elif now >= expiring_at:
+            state = STATE_EXPIRING
+            heapq.heappush(self._heap, (expiry, next(self._seq), key, STATE_EXPIRED, expiry))
+        else:
+            state = STATE_OK
+            heapq.heappush(self._heap, (expiring_at, next(self._seq), key, STATE_EXPIRING, expiry))
+            heapq.heappush(self._heap, (expiry, next(self._seq), key, STATE_EXPIRED, expiry))
+
+        changed = self._states.get(key) != state
+        self._states[key] = state
+        self._async_schedule()
+        if changed:
+            self._async_notify()
+
+    @callback
+    def async_remove(self, key: str):
+        """Stop tracking a product; its heap entries are dropped lazily."""
+        self._names.pop(key, None)
+        if self._expiries.pop(key, None) is None:
+            return
+        state = self._states.pop(key, None)
+        self._async_schedule()
+        if state != STATE_OK:
+            self._async_notify()
+
+    @callback
+    def async_retain(self, keys: set):
+        """Stop tracking every product whose key is not in keys."""
+        for key in [key for key in self._expiries if key not in keys]:
+            self.async_remove(key)
+
+    @callback
+    def async_stop(self):
+        """Cancel the pending timer."""
+        if self._timer_unsub:
+            self._timer_unsub()
+        self._timer_unsub = None
+        self._timer_at = None
+
+    def _is_current(self, item) -> bool:
+        _, _, key, _, expiry = item
+        return self._expiries.get(key) == expiry
+
+    @callback
+    def _async_schedule(self):
+        """Point the single timer at the earliest live transition."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        next_at = self._heap[0][0] if self._heap else None
+        if next_at == self._timer_at:
+            return
+
+        self.async_stop()
+        if next_at is not None:
+            self._timer_at = next_at
+            self._timer_unsub = async_track_point_in_time(self._hass, self._async_handle_timer, next_at)
+
+    @callback
+    def _async_handle_timer(self, now: datetime):
+        """Fire events for every transition that is due, then reschedule."""
+        self._timer_unsub = None
+        self._timer_at = None
+        changed = False
+
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if not self._is_current(item):
+                continue
+            _, _, key, state, expiry = item
+            if self._states.get(key) == state:
+                continue
+            self._states[key] = state
+            changed = True
+            self._hass.bus.async_fire(
+                EVENT_EXPIRED if state == STATE_EXPIRED else EVENT_EXPIRING,
+                {
+                    "entity_id": key,
+                    "product_name": self._names.get(key),
+                    "expiry": expiry.isoformat(),
+                },
+            )
+            _LOGGER.info("Product %s is %s (expiry %s).", self._names.get(key), state, expiry)
+
+        self._async_schedule()
+        if changed:
+            self._async_notify()
+
+    @callback
+    def _async_notify(self):
+        for listener in self._listeners:
+            listener()
@@ -0,0 +1,326 @@
+# custom_components/pantry_tracker/image_cache.py
+
+import asyncio
+from datetime import timedelta
+import hashlib
+import io
+import logging
+import os
+from collections import OrderedDict
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.auth import async_sign_path
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DOMAIN,
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_THUMBNAIL_SIZE,
+    IMAGE_MAX_DOWNLOAD_BYTES,
+)
+
+# Optional, used to downscale thumbnails; originals are served without it
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - depends on the environment
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_IMAGE_CACHE = f"{DOMAIN}_image_cache"
+IMAGE_VIEW_URL = f"/api/{DOMAIN}/image/{{entity_id}}"
+
+# Signed links are short-lived; sensors re-sign them once half of this has passed
+IMAGE_LINK_EXPIRATION = timedelta(days=1)
+
+# Only raster formats are cached and served; SVG and anything else could
+# carry script that would run on Home Assistant's origin
+RASTER_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+RASTER_EXTENSIONS = {ext: content_type for content_type, ext in RASTER_TYPES.items()}
+
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "Content-Security-Policy": "default-src 'none'; sandbox",
+}
+
+
+def image_version(url: str) -> str:
+    """Stable cache key for an image URL; a new URL gives a new key."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+def async_sign_image_paths(hass: HomeAssistant, entity_id: str, url: str) -> dict:
+    """Return signed, versioned thumbnail and full-size links for a product image."""
+    base = IMAGE_VIEW_URL.format(entity_id=entity_id)
+    version = image_version(url)
+    return {
+        "image": async_sign_path(
+            hass, f"{base}?v={version}", IMAGE_LINK_EXPIRATION, use_content_user=True
+        ),
+        "image_full": async_sign_path(
+            hass, f"{base}?size=full&v={version}", IMAGE_LINK_EXPIRATION, use_content_user=True
+        ),
+    }
+
+
+def _make_thumbnail(data: bytes, size: int) -> bytes:
+    """Downscale an image to fit in size x size, encoded as JPEG."""
+    with Image.open(io.BytesIO(data)) as img:
+        img.thumbnail((size, size))
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        out = io.BytesIO()
+        img.save(out, "JPEG", quality=85)
+        return out.getvalue()
+
+
+class ProductImageCache:
+    """
+    Size-bounded LRU disk cache for product images and their thumbnails.
+
+    Files are named '<version>.<variant><ext>' so the content type survives a
+    restart and all variants of one URL can be dropped together. The LRU order
+    lives in memory and is rebuilt from file mtimes on load. Concurrent
+    requests for the same image share a single download.
+    """
+
+    def __init__(self, hass: HomeAssistant, cache_dir: str, max_bytes: int = IMAGE_CACHE_MAX_BYTES):
+        self._hass = hass
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()  # filename -> size, least recently used first
+        self._total_bytes = 0
+        self._inflight = {}
+
+    async def async_load(self):
+        """Index the files already on disk."""
+        def _scan():
+            os.makedirs(self._cache_dir, exist_ok=True)
+            files = []
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.endswith(".tmp"):
+                    os.remove(entry.path)  # Left over from an interrupted write
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name, stat.st_size))
+            return sorted(files)
+
+        for _, name, size in await self._hass.async_add_executor_job(_scan):
+            self._entries[name] = size
+            self._total_bytes += size
+        _LOGGER.debug("Image cache holds %d files (%d bytes).", len(self._entries), self._total_bytes)
+
+    def _find(self, version: str, variant: str):
+        prefix = f"{version}.{variant}"
+        for name in self._entries:
+            if name.startswith(prefix):
+                return name
+        return None
+
+    async def async_get(self, url: str, thumbnail: bool = True):
+        """Return (body, content_type) for the image at url, fetching it once if needed."""
+        version = image_version(url)
+        # Without Pillow there is nothing to downscale with, so serve the original
+        variant = "thumb" if thumbnail and Image is not None else "full"
+
+        name = self._find(version, variant)
+        if name is None:
+            task = self._inflight.get((version, variant))
+            if task is None:
+                task = asyncio.ensure_future(self._async_populate(url, version, variant))
+                self._inflight[(version, variant)] = task
+                task.add_done_callback(lambda _: self._inflight.pop((version, variant), None))
+            name = await asyncio.shield(task)
+            if name is None:
+                return None
+
+        path = os.path.join(self._cache_dir, name)
+        try:
+            body = await self._hass.async_add_executor_job(self._read, path)
+        except OSError as e:
+            _LOGGER.warning("Cached image %s unreadable, dropping it: %s", name, e)
+            self._forget(name)
+            return None
+
+        content_type = RASTER_EXTENSIONS.get(os.path.splitext(name)[1])
+        if content_type is None:
+            _LOGGER.warning("Cached image %s is not a supported raster type, dropping it.", name)
+            await self._async_drop([name])
+            return None
+
+        self._entries.move_to_end(name)
+        return body, content_type
+
+    async def _async_populate(self, url: str, version: str, variant: str):
+        """Download (or reuse) the original and store the requested variant."""
+        full_name = self._find(version, "full")
+        body = None
+        if full_name is not None:
+            try:
+                body = await self._hass.async_add_executor_job(
+                    self._read, os.path.join(self._cache_dir, full_name)
+                )
+            except OSError:
+                self._forget(full_name)
+        if body is None:
+            fetched = await self._async_download(url)
+            if fetched is None:
+                return None
+            body, content_type = fetched
+            full_name = await self._async_store(f"{version}.full{RASTER_TYPES[content_type]}", body)
+
+        if variant == "full":
+            return full_name
+
+        try:
+            thumb = await self._hass.async_add_executor_job(_make_thumbnail, body, IMAGE_THUMBNAIL_SIZE)
+        except Exception as e:
+            _LOGGER.warning("Could not create thumbnail for %s: %s", url, e)
+            return full_name
+        return await self._async_store(f"{version}.thumb.jpg", thumb)
+
+    async def _async_download(self, url: str):
+        session = async_get_clientsession(self._hass)
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                if resp.status != 200:
+                    _LOGGER.warning("Failed to fetch image %s. Status Code=%s", url, resp.status)
+                    return None
+                if resp.content_type not in RASTER_TYPES:
+                    _LOGGER.warning(
+                        "URL %s did not return a supported raster image (%s).", url, resp.content_type
+                    )
+                    return None
+                body = bytearray()
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) > IMAGE_MAX_DOWNLOAD_BYTES:
+                        _LOGGER.warning("Image %s exceeds %d bytes; not caching it.", url, IMAGE_MAX_DOWNLOAD_BYTES)
+                        return None
+                return bytes(body), resp.content_type
+        except Exception as e:
+            _LOGGER.error("Error while fetching image %s: %s", url, e)
+            return None
+
+    async def _async_store(self, name: str, body: bytes) -> str:
+        path = os.path.join(self._cache_dir, name)
+        await self._hass.async_add_executor_job(self._write, path, body)
+        if name in self._entries:
+            self._total_bytes -= self._entries[name]
+        self._entries[name] = len(body)
+        self._entries.move_to_end(name)
+        self._total_bytes += len(body)
+        await self._async_evict(keep=name)
+        return name
+
+    async def _async_evict(self, keep: str):
+        """Drop least recently used files until the cache fits its budget."""
+        victims = []
+        for name in list(self._entries):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if name == keep:
+                continue
+            victims.append(name)
+            self._forget(name)
+        if victims:
+            await self._hass.async_add_executor_job(self._unlink, victims)
+            _LOGGER.debug("Evicted %d images from cache.", len(victims))
+
+    async def async_invalidate(self, url: str):
+        """Remove every cached variant of an image, e.g. when a product's URL changes."""
+        prefix = f"{image_version(url)}."
+        await self._async_drop([name for name in self._entries if name.startswith(prefix)])
+
+    async def _async_drop(self, names: list):
+        for name in names:
+            self._forget(name)
+        if names:
+            await self._hass.async_add_executor_job(self._unlink, names)
+
+    def _forget(self, name: str):
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            body = f.read()
+        os.utime(path)  # Keep LRU order across restarts
+        return body
+
+    def _write(self, path: str, body: bytes):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    def _unlink(self, names: list):
+        for name in names:
+            try:
+                os.remove(os.path.join(self._cache_dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                _LOGGER.error("Error deleting cached image %s: %s", name, e)
+
+
+class ProductImageView(HomeAssistantView):
+    """Serve cached product images; links carry a signature and the image URL version."""
+
+    url = IMAGE_VIEW_URL
+    name = f"api:{DOMAIN}:image"
+    requires_auth = True
+
+    def __init__(self, cache: ProductImageCache):
+        self._cache = cache
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        hass = request.app["hass"]
+        image_url = None
+        for entry_data in hass.data.get(DOMAIN, {}).values():
+            sensor = entry_data.get("entities", {}).get(entity_id) if isinstance(entry_data, dict) else None
+            if sensor is not None and getattr(sensor, "image_url", None):
+                image_url = sensor.image_url
+                break
+        if not image_url:
+            return web.Response(status=404, headers=SECURITY_HEADERS)
+
+        version = image_version(image_url)
+        thumbnail = request.query.get("size") != "full"
+        etag = f'"{version}-{"thumb" if thumbnail else "full"}"'
+        # Versioned links never change content; unversioned ones must revalidate
+        if request.query.get("v") == version:
+            cache_control = "private, max-age=31536000, immutable"
+        else:
+            cache_control = "private, no-cache"
+        headers = {"ETag": etag, "Cache-Control": cache_control, **SECURITY_HEADERS}
+
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+
+        image = await self._cache.async_get(image_url, thumbnail)
+        if image is None:
+            return web.Response(status=502, headers=SECURITY_HEADERS)
+        body, content_type = image
+        return web.Response(body=body, content_type=content_type, headers=headers)
+
+
+async def async_get_image_cache(hass: HomeAssistant) -> ProductImageCache:
+    """Return the shared image cache, creating it and registering its view on first use."""
+    cache = hass.data.get(DATA_IMAGE_CACHE)
+    if cache is None:
+        cache = ProductImageCache(hass, hass.config.path(".cache", DOMAIN, "images"))
+        hass.data[DATA_IMAGE_CACHE] = cache
+        await cache.async_load()
+        hass.http.register_view(ProductImageView(cache))
+    return cache
@@ -0,0 +1,89 @@
+# custom_components/pantry_tracker/product_filter.py
+
+import fnmatch
+import logging
+import re
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    CONF_INCLUDE_CATEGORIES,
+    CONF_INCLUDE_TAGS,
+    CONF_INCLUDE_NAMES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def split_option(value) -> list:
+    """Split a comma-separated string (or a list) into a list of trimmed strings."""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        items = value
+    else:
+        items = str(value).split(",")
+    values = []
+    for item in items:
+        if isinstance(item, dict):
+            # Tags may arrive as objects, e.g. {"name": "spices"}
+            item = item.get("name")
+        if item is None:
+            continue
+        item = str(item).strip()
+        if item:
+            values.append(item)
+    return values
+
+
+class ProductFilter:
+    """
+    Decide which products are materialised as entities.
+
+    Categories and tags are matched case-insensitively; name patterns are
+    shell-style globs (e.g. 'Milk*') compiled into a single regex up front so
+    each reconciliation only does set lookups and one regex match per product.
+    An empty filter matches everything.
+    """
+
+    def __init__(self, categories=None, tags=None, name_patterns=None):
+        self._categories = frozenset(c.casefold() for c in split_option(categories))
+        self._tags = frozenset(t.casefold() for t in split_option(tags))
+        patterns = split_option(name_patterns)
+        self._name_regex = (
+            re.compile("|".join(fnmatch.translate(p) for p in patterns), re.IGNORECASE)
+            if patterns else None
+        )
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> "ProductFilter":
+        """Build the filter from the config entry options."""
+        return cls(
+            categories=entry.options.get(CONF_INCLUDE_CATEGORIES, ""),
+            tags=entry.options.get(CONF_INCLUDE_TAGS, ""),
+            name_patterns=entry.options.get(CONF_INCLUDE_NAMES, ""),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._categories and not self._tags and self._name_regex is None
+
+    def matches(self, product: dict) -> bool:
+        """Return True if the product should become an entity."""
+        if self.is_empty:
+            return True
+
+        category = str(product.get("category") or "")
+        if self._categories and category.casefold() in self._categories:
+            return True
+
+        if self._tags:
+            for tag in split_option(product.get("tags")):
+                if tag.casefold() in self._tags:
+                    return True
+
+        name = str(product.get("name") or "")
+        if self._name_regex is not None and self._name_regex.match(name):
+            return True
+
+        return False
@@ -1,5 +1,6 @@
 # custom_components/pantry_tracker/sensor.py
 
+import asyncio
 import logging
 from datetime import timedelta
 
@@ -8,11 +9,13 @@ import voluptuous as vol
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -20,7 +23,20 @@ from .const import (
     CONF_HOST,
     CONF_PORT,
     CONF_API_KEY,
+    CONF_EXPIRY_WARNING_DAYS,
+    OPTION_DEFAULTS,
 )
+from .product_filter import ProductFilter
+from .codec import read_response, request_headers
+from .command_queue import ProductCommandQueue
+from .expiry import ExpiryTracker, parse_expiry, STATE_EXPIRING, STATE_EXPIRED
+from .image_cache import (
+    IMAGE_LINK_EXPIRATION,
+    ProductImageCache,
+    async_get_image_cache,
+    async_sign_image_paths,
+)
+from .barcode_cache import BarcodeLookupCache, BarcodeLookupError, fetch_product_from_api
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +55,10 @@ BARCODE_OPERATION_SCHEMA = vol.Schema({
     vol.Optional("amount", default=1): vol.Coerce(int)
 })
 
+FETCH_PRODUCT_SCHEMA = vol.Schema({
+    vol.Required("barcode"): cv.string,
+})
+
 
 def sanitize_entity_id(name: str) -> str:
     """Sanitize product name to create a unique entity ID."""
@@ -77,6 +97,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         CONF_API_KEY,
         entry.data.get(CONF_API_KEY, "")
     )
+    expiry_warning_days = entry.options.get(
+        CONF_EXPIRY_WARNING_DAYS,
+        OPTION_DEFAULTS[CONF_EXPIRY_WARNING_DAYS]
+    )
 
     # Ensure host does not contain 'http://' or 'https://'
     if "://" in host:
@@ -114,6 +138,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entry_data["products"] = []
     entry_data["product_counts"] = {}
     entry_data["entities"] = {}
+    entry_data["transport_stats"] = {}
+    entry_data["command_queue"] = ProductCommandQueue()
+    entry_data["poll_snapshot"] = {}
+
+    expiry_tracker = ExpiryTracker(hass, timedelta(days=expiry_warning_days))
+    entry_data["expiry_tracker"] = expiry_tracker
+    entry.async_on_unload(expiry_tracker.async_stop)
+
+    try:
+        entry_data["image_cache"] = await async_get_image_cache(hass)
+    except Exception as e:
+        _LOGGER.error("Failed to set up the product image cache: %s", e)
+        entry_data["image_cache"] = None
+
+    async def async_fetch_barcode(barcode: str):
+        return await fetch_product_from_api(session, source, barcode, entry_data["transport_stats"])
+
+    barcode_cache = BarcodeLookupCache(hass, entry.entry_id, async_fetch_barcode)
+    await barcode_cache.async_load()
+    entry_data["barcode_cache"] = barcode_cache
+    entry_data["options"] = dict(entry.options)
 
     async def async_shutdown(event):
         if session:
@@ -129,38 +174,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     cat_sensor = CategoriesSensor(entry, entry_data["categories"])
     entry_data["entities"]["pantry_categories"] = cat_sensor
 
-    # Create product sensors
-    product_sensors = []
-    for p in entry_data["products"]:
-        try:
-            product_attributes = p.copy()
-            name = product_attributes.pop("name")
-            unique_id = sanitize_entity_id(name)
-            url = product_attributes.pop("url", "")
-            category = product_attributes.pop("category", "")
-        except KeyError as e:
-            _LOGGER.error("Product missing key %s: %s", e, p)
-            continue
+    # Create the expiry count sensors
+    expiring_sensor = ExpiryCountSensor(entry, expiry_tracker, STATE_EXPIRING)
+    expired_sensor = ExpiryCountSensor(entry, expiry_tracker, STATE_EXPIRED)
+    entry_data["entities"]["pantry_expiring_soon"] = expiring_sensor
+    entry_data["entities"]["pantry_expired"] = expired_sensor
 
-        entity_id = sanitize_entity_id(name)
-        current_count = entry_data["product_counts"].get(entity_id, 0)
-        sensor = ProductSensor(
-            config_entry=entry,
-            name=name,
-            url=url,
-            category=category,
-            unique_id=unique_id,
-            initial_count=current_count,
-            additional_attributes=product_attributes
-        )
-        product_sensors.append(sensor)
-        entry_data["entities"][entity_id] = sensor
-
-    # Add sensors
-    sensors_to_add = [cat_sensor] + product_sensors
-    if sensors_to_add:
-        _LOGGER.info("Adding %d sensors (including categories).", len(sensors_to_add))
-        async_add_entities(sensors_to_add, True)
+    # Create the barcode lookup cache sensor
+    barcode_cache_sensor = BarcodeCacheSensor(entry, barcode_cache)
+    entry_data["entities"]["pantry_barcode_cache"] = barcode_cache_sensor
+
+    async_add_entities([cat_sensor, expiring_sensor, expired_sensor, barcode_cache_sensor], True)
+
+    # Create product sensors for the products that pass the entity filter
+    entry_data["product_filter"] = ProductFilter.from_entry(entry)
+    await async_reconcile_products(hass, entry, entry_data, async_add_entities)
+
+    async def async_refilter():
+        """Re-apply the entity filter after an options change, without a reload."""
+        entry_data["product_filter"] = ProductFilter.from_entry(entry)
+        await async_reconcile_products(hass, entry, entry_data, async_add_entities)
+
+    entry_data["refilter"] = async_refilter
 
     # ---------------------------------------------
     # Track time interval for periodic updates
@@ -182,25 +217,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         await handle_decrease_count_service(hass, call, session, source, entry_data)
 
     async def async_barcode_increase(call: ServiceCall):
-        await handle_barcode_increase_service(hass, call, entry_data)
+        await handle_barcode_increase_service(hass, call, session, source, entry_data)
 
     async def async_barcode_decrease(call: ServiceCall):
-        await handle_barcode_decrease_service(hass, call, entry_data)
+        await handle_barcode_decrease_service(hass, call, session, source, entry_data)
+
+    async def async_fetch_product(call: ServiceCall) -> ServiceResponse:
+        return await handle_fetch_product_service(hass, call, entry_data)
 
     hass.services.async_register(DOMAIN, "increase_count", async_increase_count, schema=INCREASE_COUNT_SCHEMA)
     hass.services.async_register(DOMAIN, "decrease_count", async_decrease_count, schema=DECREASE_COUNT_SCHEMA)
     hass.services.async_register(DOMAIN, "barcode_increase", async_barcode_increase, schema=BARCODE_OPERATION_SCHEMA)
     hass.services.async_register(DOMAIN, "barcode_decrease", async_barcode_decrease, schema=BARCODE_OPERATION_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, "fetch_product", async_fetch_product,
+        schema=FETCH_PRODUCT_SCHEMA, supports_response=SupportsResponse.ONLY
+    )
 
     return True  # Explicitly return True to indicate successful setup
 
 
 async def fetch_pantry_data(session, source, entry_data):
     """Fetch categories, products, and counts from your external API."""
+    stats = entry_data.setdefault("transport_stats", {})
+
     try:
-        async with session.get(f"{source}/categories") as resp:
+        async with session.get(f"{source}/categories", headers=request_headers()) as resp:
             if resp.status == 200:
-                categories = await resp.json()
+                categories = await read_response(resp, "categories", stats)
                 if isinstance(categories, list):
                     entry_data["categories"] = categories
                 else:
@@ -214,9 +258,9 @@ async def fetch_pantry_data(session, source, entry_data):
         entry_data["categories"] = []
 
     try:
-        async with session.get(f"{source}/products") as resp:
+        async with session.get(f"{source}/products", headers=request_headers()) as resp:
             if resp.status == 200:
-                products = await resp.json()
+                products = await read_response(resp, "products", stats)
                 if isinstance(products, list):
                     entry_data["products"] = products
                 else:
@@ -230,9 +274,9 @@ async def fetch_pantry_data(session, source, entry_data):
         entry_data["products"] = []
 
     try:
-        async with session.get(f"{source}/counts") as resp:
+        async with session.get(f"{source}/counts", headers=request_headers()) as resp:
             if resp.status == 200:
-                counts = await resp.json()
+                counts = await read_response(resp, "counts", stats)
                 if isinstance(counts, dict):
                     entry_data["product_counts"] = counts
                 else:
@@ -249,15 +293,29 @@ async def fetch_pantry_data(session, source, entry_data):
 async def async_update_sensors(hass: HomeAssistant, entry: ConfigEntry, entry_data, source, async_add_entities):
     """Async method to update categories/products and sync sensors."""
     session = entry_data["session"]
+    queue = entry_data["command_queue"]
 
+    # Remember which commands had finished before fetching, so counts from this
+    # poll don't overwrite changes made while the request was in flight
+    snapshot = queue.snapshot()
     await fetch_pantry_data(session, source, entry_data)
+    entry_data["poll_snapshot"] = snapshot
 
     # Update categories sensor
     cat_sensor = entry_data["entities"].get("pantry_categories")
     if cat_sensor and isinstance(cat_sensor, CategoriesSensor):
         cat_sensor.update_categories(entry_data["categories"])
 
+    await async_reconcile_products(hass, entry, entry_data, async_add_entities)
+    queue.log_stats()
+
+
+async def async_reconcile_products(hass: HomeAssistant, entry: ConfigEntry, entry_data, async_add_entities):
+    """Sync product sensors with the last fetched products, applying the entity filter."""
+    product_filter = entry_data.get("product_filter")
+    expiry_tracker = entry_data.get("expiry_tracker")
     fetched_entity_ids = set()
+    materialised_entity_ids = set()
     new_sensors = []
 
     for p in entry_data["products"]:
@@ -274,6 +332,14 @@ async def async_update_sensors(hass: HomeAssistant, entry: ConfigEntry, entry_da
         entity_id = sanitize_entity_id(name)
         fetched_entity_ids.add(entity_id)
 
+        # Expiry is aggregated across all products, including filtered-out ones
+        if expiry_tracker is not None:
+            expiry_tracker.async_update(entity_id, name, parse_expiry(product_attributes))
+
+        if product_filter is not None and not product_filter.matches(p):
+            continue
+        materialised_entity_ids.add(entity_id)
+
         existing = entry_data["entities"].get(entity_id)
         if isinstance(existing, ProductSensor):
             # Update existing sensor
@@ -288,49 +354,62 @@ async def async_update_sensors(hass: HomeAssistant, entry: ConfigEntry, entry_da
                 category=category,
                 unique_id=unique_id,
                 initial_count=current_count,
-                additional_attributes=product_attributes
+                additional_attributes=product_attributes,
+                image_cache=entry_data.get("image_cache")
             )
             entry_data["entities"][entity_id] = sensor
             new_sensors.append(sensor)
             _LOGGER.info("Detected new product '%s'. Adding sensor.", name)
 
-    # Remove disappeared products
-    existing_ids = set(entry_data["entities"].keys())
-    removed_ids = existing_ids - fetched_entity_ids - {"pantry_categories"}
+    # Remove disappeared or filtered-out products
+    existing_ids = {
+        eid for eid, sensor in entry_data["entities"].items()
+        if isinstance(sensor, ProductSensor)
+    }
+    removed_ids = existing_ids - materialised_entity_ids
     for rid in removed_ids:
         sensor = entry_data["entities"].pop(rid, None)
         if sensor:
             _LOGGER.info("Removed sensor for entity_id %s as it's no longer present.", rid)
             await remove_entity_async(hass, rid)
 
+    # Stop tracking expiry only for products that are no longer fetched at all
+    if expiry_tracker is not None:
+        expiry_tracker.async_retain(fetched_entity_ids)
+
     # Add new sensors
     if new_sensors:
         _LOGGER.info("Adding %d new product sensors.", len(new_sensors))
         async_add_entities(new_sensors, True)
 
-    # Update counts on all product sensors
+    # Update counts on existing product sensors; new ones already carry theirs
+    queue = entry_data.get("command_queue")
+    snapshot = entry_data.get("poll_snapshot", {})
     for entity_id, count in entry_data["product_counts"].items():
         sensor = entry_data["entities"].get(entity_id)
-        if isinstance(sensor, ProductSensor):
-            sensor.update_count(count)
+        if not isinstance(sensor, ProductSensor) or sensor in new_sensors:
+            continue
+        if queue is not None and queue.is_stale(entity_id, snapshot):
+            queue.stats["skipped_stale_counts"] += 1
+            _LOGGER.debug("Skipping polled count for %s; a local command is newer.", entity_id)
+            continue
+        sensor.update_count(count)
 
 
 # --------------------------- Service Handlers ---------------------------
-async def handle_increase_count_service(hass: HomeAssistant, call: ServiceCall, session, source, entry_data):
-    entity_id = call.data["entity_id"]
-    amount = call.data["amount"]
-
-    sensor = entry_data["entities"].get(entity_id)
-    if not sensor or not isinstance(sensor, ProductSensor):
-        _LOGGER.error("Entity %s not found for increase_count", entity_id)
-        return
+async def post_count_update(session, source, sensor, action: str, amount: int):
+    """
+    Send a count change to the API and apply the returned count to the sensor.
 
+    Failures are logged and raised as HomeAssistantError, so the command queue
+    counts them and the service call reports the error.
+    """
     try:
         async with session.post(
             f"{source}/update_count",
             json={
                 "product_name": sensor._product_name,
-                "action": "increase",
+                "action": action,
                 "amount": amount
             }
         ) as response:
@@ -339,13 +418,44 @@ async def handle_increase_count_service(hass: HomeAssistant, call: ServiceCall,
                 if data.get("status") == "ok":
                     new_count = data.get("count")
                     sensor.update_count(new_count)
-                    _LOGGER.debug("Successfully increased count via API.")
+                    _LOGGER.debug("Successfully %sd count via API.", action)
                 else:
-                    _LOGGER.error("Failed to increase count via API: %s", data.get("message"))
+                    _LOGGER.error("Failed to %s count via API: %s", action, data.get("message"))
+                    raise HomeAssistantError(f"Failed to {action} count via API: {data.get('message')}")
             else:
-                _LOGGER.error("Failed to increase count. Status=%s", response.status)
+                _LOGGER.error("Failed to %s count. Status=%s", action, response.status)
+                raise HomeAssistantError(f"Failed to {action} count. Status={response.status}")
+    except HomeAssistantError:
+        raise
     except Exception as e:
-        _LOGGER.error("Unexpected error while increasing count via API: %s", e)
+        _LOGGER.error("Unexpected error while updating count (%s) via API: %s", action, e)
+        raise HomeAssistantError(f"Unexpected error while updating count ({action}) via API: {e}") from e
+
+
+async def run_barcode_commands(entry_data, session, source, matching_sensors: dict, action: str, amount: int):
+    """Queue a count change for every matching product and raise the first failure, if any."""
+    queue = entry_data["command_queue"]
+    results = await asyncio.gather(*(
+        queue.run(entity_id, lambda sensor=sensor: post_count_update(session, source, sensor, action, amount))
+        for entity_id, sensor in matching_sensors.items()
+    ), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+async def handle_increase_count_service(hass: HomeAssistant, call: ServiceCall, session, source, entry_data):
+    entity_id = call.data["entity_id"]
+    amount = call.data["amount"]
+
+    sensor = entry_data["entities"].get(entity_id)
+    if not sensor or not isinstance(sensor, ProductSensor):
+        _LOGGER.error("Entity %s not found for increase_count", entity_id)
+        return
+
+    await entry_data["command_queue"].run(
+        entity_id, lambda: post_count_update(session, source, sensor, "increase", amount)
+    )
 
 
 async def handle_decrease_count_service(hass: HomeAssistant, call: ServiceCall, session, source, entry_data):
@@ -357,63 +467,68 @@ async def handle_decrease_count_service(hass: HomeAssistant, call: ServiceCall,
         _LOGGER.error("Entity %s not found for decrease_count", entity_id)
         return
 
-    try:
-        async with session.post(
-            f"{source}/update_count",
-            json={
-                "product_name": sensor._product_name,
-                "action": "decrease",
-                "amount": amount
-            }
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data.get("status") == "ok":
-                    new_count = data.get("count")
-                    sensor.update_count(new_count)
-                    _LOGGER.debug("Successfully decreased count via API.")
-                else:
-                    _LOGGER.error("Failed to decrease count via API: %s", data.get("message"))
-            else:
-                _LOGGER.error("Failed to decrease count. Status=%s", response.status)
-    except Exception as e:
-        _LOGGER.error("Unexpected error while decreasing count via API: %s", e)
+    await entry_data["command_queue"].run(
+        entity_id, lambda: post_count_update(session, source, sensor, "decrease", amount)
+    )
 
 
-async def handle_barcode_increase_service(hass: HomeAssistant, call: ServiceCall, entry_data):
+def find_sensors_by_barcode(entry_data, barcode: str) -> dict:
+    """Return {entity_id: sensor} for product sensors carrying the given barcode."""
+    return {
+        entity_id: s for entity_id, s in entry_data["entities"].items()
+        if isinstance(s, ProductSensor) and s.extra_state_attributes.get("barcode") == barcode
+    }
+
+
+async def handle_barcode_increase_service(hass: HomeAssistant, call: ServiceCall, session, source, entry_data):
     barcode = call.data["barcode"]
     amount = call.data["amount"]
 
-    matching_sensors = [
-        s for s in entry_data["entities"].values()
-        if isinstance(s, ProductSensor) and s.extra_state_attributes.get("barcode") == barcode
-    ]
+    matching_sensors = find_sensors_by_barcode(entry_data, barcode)
     if not matching_sensors:
         _LOGGER.error("No sensor found with barcode %s", barcode)
         return
 
-    for sensor in matching_sensors:
-        new_count = sensor.native_value + amount
-        sensor.update_count(new_count)
-        _LOGGER.info("Increased count for sensor %s by %s. New count: %s", sensor.entity_id, amount, new_count)
+    # Send the change to the add-on so the next poll agrees with it
+    await run_barcode_commands(entry_data, session, source, matching_sensors, "increase", amount)
+    _LOGGER.info("Processed barcode_increase of %s for barcode %s.", amount, barcode)
 
 
-async def handle_barcode_decrease_service(hass: HomeAssistant, call: ServiceCall, entry_data):
+async def handle_barcode_decrease_service(hass: HomeAssistant, call: ServiceCall, session, source, entry_data):
     barcode = call.data["barcode"]
     amount = call.data["amount"]
 
-    matching_sensors = [
-        s for s in entry_data["entities"].values()
-        if isinstance(s, ProductSensor) and s.extra_state_attributes.get("barcode") == barcode
-    ]
+    matching_sensors = find_sensors_by_barcode(entry_data, barcode)
     if not matching_sensors:
         _LOGGER.error("No sensor found with barcode %s", barcode)
         return
 
-    for sensor in matching_sensors:
-        new_count = max(sensor.native_value - amount, 0)
-        sensor.update_count(new_count)
-        _LOGGER.info("Decreased count for sensor %s by %s. New count: %s", sensor.entity_id, amount, new_count)
+    # Send the change to the add-on so the next poll agrees with it
+    await run_barcode_commands(entry_data, session, source, matching_sensors, "decrease", amount)
+    _LOGGER.info("Processed barcode_decrease of %s for barcode %s.", amount, barcode)
+
+
+async def handle_fetch_product_service(hass: HomeAssistant, call: ServiceCall, entry_data) -> ServiceResponse:
+    barcode = call.data["barcode"]
+    barcode_cache = entry_data["barcode_cache"]
+
+    try:
+        product, cached = await barcode_cache.async_lookup(barcode)
+    except BarcodeLookupError as e:
+        _LOGGER.error("Failed to fetch product for barcode %s: %s", barcode, e)
+        raise HomeAssistantError(f"Failed to fetch product for barcode {barcode}: {e}") from e
+    finally:
+        cache_sensor = entry_data["entities"].get("pantry_barcode_cache")
+        if isinstance(cache_sensor, BarcodeCacheSensor) and cache_sensor.hass is not None:
+            cache_sensor.async_write_ha_state()
+
+    _LOGGER.debug("Barcode %s lookup: found=%s cached=%s", barcode, product is not None, cached)
+    return {
+        "barcode": barcode,
+        "found": product is not None,
+        "cached": cached,
+        "product": product,
+    }
 
 
 # --------------------------- Entities ---------------------------
@@ -450,9 +565,82 @@ class CategoriesSensor(SensorEntity):
         self.async_write_ha_state()
 
 
+class BarcodeCacheSensor(SensorEntity):
+    """Sensor reporting the barcode lookup cache hit rate."""
+
+    _attr_icon = "mdi:barcode"
+    _attr_native_unit_of_measurement = "%"
+
+    def __init__(self, entry: ConfigEntry, barcode_cache: BarcodeLookupCache):
+        self._entry = entry
+        self._barcode_cache = barcode_cache
+        self._attr_unique_id = f"{DOMAIN}_barcode_cache"
+        self._attr_name = "Pantry Barcode Cache Hit Rate"
+
+    @property
+    def native_value(self):
+        return self._barcode_cache.hit_rate
+
+    @property
+    def extra_state_attributes(self):
+        return self._barcode_cache.summary()
+
+    @property
+    def device_info(self):
+        """Attach under the same device as CategoriesSensor."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": "Pantry Tracker",
+            "manufacturer": "Pantry Tracker"
+        }
+
+
+class ExpiryCountSensor(SensorEntity):
+    """Sensor counting products that are expiring soon or already expired."""
+
+    def __init__(self, entry: ConfigEntry, tracker: ExpiryTracker, state: str):
+        self._entry = entry
+        self._tracker = tracker
+        self._state = state
+        if state == STATE_EXPIRED:
+            self._attr_unique_id = f"{DOMAIN}_expired"
+            self._attr_name = "Pantry Expired"
+            self._attr_icon = "mdi:calendar-remove"
+        else:
+            self._attr_unique_id = f"{DOMAIN}_expiring_soon"
+            self._attr_name = "Pantry Expiring Soon"
+            self._attr_icon = "mdi:calendar-alert"
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._tracker.add_listener(self._handle_tracker_update))
+
+    @property
+    def native_value(self):
+        return self._tracker.count(self._state)
+
+    @property
+    def extra_state_attributes(self):
+        return {"products": self._tracker.products_in_state(self._state)}
+
+    @property
+    def device_info(self):
+        """Attach under the same device as CategoriesSensor."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": "Pantry Tracker",
+            "manufacturer": "Pantry Tracker"
+        }
+
+    def _handle_tracker_update(self):
+        self.async_write_ha_state()
+
+
 class ProductSensor(SensorEntity):
     """Sensor to track individual product counts and attributes."""
 
+    # Signed image links change every time they are re-signed; keep them out of history
+    _unrecorded_attributes = frozenset({"entity_picture", "image", "image_full"})
+
     def __init__(
         self,
         config_entry: ConfigEntry,
@@ -461,7 +649,8 @@ class ProductSensor(SensorEntity):
         category: str,
         unique_id: str,
         initial_count: int = 0,
-        additional_attributes: dict = None
+        additional_attributes: dict = None,
+        image_cache: ProductImageCache = None
     ):
         self._entry = config_entry
         self._product_name = name
@@ -472,11 +661,26 @@ class ProductSensor(SensorEntity):
         self._attr_icon = "mdi:barcode-scan"
         self._count = initial_count
         self._additional_attributes = additional_attributes or {}
+        self._image_cache = image_cache
+        self._image_paths = {}
+        self._image_paths_signed_at = None
+
+    async def async_added_to_hass(self):
+        self._update_image_paths()
+
+    @property
+    def image_url(self):
+        """Remote image URL served through the image cache, if caching is enabled."""
+        return self._url if self._image_cache is not None else None
 
     @property
     def native_value(self):
         return self._count
 
+    @property
+    def entity_picture(self):
+        return self._image_paths.get("image")
+
     @property
     def extra_state_attributes(self):
         attrs = {
@@ -486,6 +690,7 @@ class ProductSensor(SensorEntity):
             "count": self._count
         }
         attrs.update(self._additional_attributes)
+        attrs.update(self._image_paths)
         return attrs
 
     @property
@@ -497,8 +702,27 @@ class ProductSensor(SensorEntity):
             "manufacturer": "PantryTracker"
         }
 
+    def _update_image_paths(self):
+        """Sign cached-image links for the current URL."""
+        if self._image_cache is None or not self._url or self.hass is None:
+            self._image_paths = {}
+            self._image_paths_signed_at = None
+            return
+        self._image_paths = async_sign_image_paths(self.hass, self._attr_unique_id, self._url)
+        self._image_paths_signed_at = dt_util.utcnow()
+
     def update_attributes(self, url: str, category: str, additional_attributes: dict):
-        self._url = url
+        if url != self._url:
+            # The old image is stale; drop it and hand out links for the new one
+            if self._image_cache is not None and self._url and self.hass is not None:
+                self.hass.async_create_task(self._image_cache.async_invalidate(self._url))
+            self._url = url
+            self._update_image_paths()
+        elif (
+            self._image_paths_signed_at is not None
+            and dt_util.utcnow() - self._image_paths_signed_at > IMAGE_LINK_EXPIRATION / 2
+        ):
+            self._update_image_paths()
         self._category = category
         if additional_attributes:
             self._additional_attributes = additional_attributes
@@ -0,0 +1 @@
+"""Tests for the Pantry Tracker integration."""
@@ -0,0 +1,122 @@
+"""Barcode lookup cache tests against a local stub of the add-on's /fetch_product."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from custom_components.pantry_tracker.barcode_cache import (
+    BarcodeLookupCache,
+    BarcodeLookupError,
+    fetch_product_from_api,
+)
+
+KNOWN = "5000000000001"
+NOT_FOUND_BODY = "5000000000002"
+NOT_FOUND_404 = "5000000000003"
+BARE_404 = "5000000000004"
+OUTAGE = "5000000000005"
+DELAY = 0.05  # Long enough for concurrent lookups to overlap
+
+
+class MemoryStore:
+    """Stands in for homeassistant.helpers.storage.Store."""
+
+    def __init__(self):
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.data = data_func()
+
+
+def _make_stub_app(calls: dict) -> web.Application:
+    async def fetch_product(request: web.Request) -> web.Response:
+        barcode = request.query["barcode"]
+        calls[barcode] = calls.get(barcode, 0) + 1
+        await asyncio.sleep(DELAY)
+        if barcode == KNOWN:
+            return web.json_response({"name": "Stub Beans", "barcode": barcode})
+        if barcode == NOT_FOUND_BODY:
+            return web.json_response({"status": "not_found"})
+        if barcode == NOT_FOUND_404:
+            return web.json_response({"found": False}, status=404)
+        if barcode == OUTAGE:
+            return web.json_response({"status": "error", "message": "upstream down"})
+        return web.Response(status=404, text="404: Not Found")
+
+    app = web.Application()
+    app.router.add_get("/fetch_product", fetch_product)
+    return app
+
+
+def _run_against_stub(scenario):
+    """Run scenario(cache, calls, stats) with a cache backed by the stub add-on."""
+    async def run():
+        calls = {}
+        runner = web.AppRunner(_make_stub_app(calls))
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        source = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            async with aiohttp.ClientSession() as session:
+                stats = {}
+                cache = BarcodeLookupCache(
+                    None, "stub",
+                    lambda barcode: fetch_product_from_api(session, source, barcode, stats),
+                    store=MemoryStore(),
+                )
+                await cache.async_load()
+                await scenario(cache, calls, stats)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_concurrent_lookups_share_one_request_and_are_cached():
+    async def scenario(cache, calls, stats):
+        results = await asyncio.gather(*(cache.async_lookup(KNOWN) for _ in range(5)))
+        assert calls[KNOWN] == 1
+        assert all(product["name"] == "Stub Beans" and not cached for product, cached in results)
+
+        product, cached = await cache.async_lookup(KNOWN)
+        assert cached and product["name"] == "Stub Beans"
+        assert calls[KNOWN] == 1
+
+        assert stats["fetch_product"]["requests"] == 1
+        assert cache.hit_rate == round(100 / 6, 1)
+        summary = cache.summary()
+        assert summary["coalesced"] == 4
+        assert summary["hits"] == 1
+        assert summary["entries"] == 1
+
+    _run_against_stub(scenario)
+
+
+@pytest.mark.parametrize("barcode", [NOT_FOUND_BODY, NOT_FOUND_404])
+def test_not_found_bodies_are_negatively_cached(barcode):
+    async def scenario(cache, calls, stats):
+        assert await cache.async_lookup(barcode) == (None, False)
+        assert await cache.async_lookup(barcode) == (None, True)
+        assert calls[barcode] == 1
+        assert cache.summary()["negative_hits"] == 1
+
+    _run_against_stub(scenario)
+
+
+@pytest.mark.parametrize("barcode", [BARE_404, OUTAGE])
+def test_failures_raise_and_are_not_cached(barcode):
+    async def scenario(cache, calls, stats):
+        for _ in range(2):
+            with pytest.raises(BarcodeLookupError):
+                await cache.async_lookup(barcode)
+        assert calls[barcode] == 2
+        assert cache.summary()["errors"] == 2
+        assert cache.summary()["entries"] == 0
+
+    _run_against_stub(scenario)
@@ -0,0 +1,96 @@
+"""Stress and ordering tests for the per-product command queue."""
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.pantry_tracker.command_queue import ProductCommandQueue
+
+PRODUCTS = 50
+COMMANDS = 40
+LATENCY = 0.001  # Simulated API round trip
+
+
+async def _stress(queue: ProductCommandQueue, counts: dict):
+    async def increase(key):
+        current = counts[key]
+        await asyncio.sleep(LATENCY)  # Yield between read and write, like a real API call
+        counts[key] = current + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        queue.run(key, lambda key=key: increase(key))
+        for _ in range(COMMANDS)
+        for key in counts
+    ))
+    return time.perf_counter() - start
+
+
+def test_concurrent_commands_are_not_lost_and_run_in_parallel_across_products():
+    queue = ProductCommandQueue()
+    counts = {f"sensor.product_{i}": 0 for i in range(PRODUCTS)}
+    snapshot = queue.snapshot()
+
+    elapsed = asyncio.run(_stress(queue, counts))
+
+    total = PRODUCTS * COMMANDS
+    print(
+        f"{total} commands over {PRODUCTS} products in {elapsed * 1000:.1f} ms "
+        f"({total / elapsed:.0f} commands/s), max depth {queue.stats['max_depth']}"
+    )
+    assert all(count == COMMANDS for count in counts.values())
+    assert queue.stats["commands"] == total
+    assert queue.stats["failed"] == 0
+    assert queue.stats["max_depth"] == COMMANDS
+    # Fully serial execution would take at least total * LATENCY
+    assert elapsed < total * LATENCY / 5
+    # A poll that started before the burst must not overwrite any product
+    assert all(queue.is_stale(key, snapshot) for key in counts)
+
+
+def test_commands_for_one_product_run_in_order():
+    queue = ProductCommandQueue()
+    applied = []
+
+    async def command(n):
+        await asyncio.sleep(0)
+        applied.append(n)
+
+    async def run():
+        await asyncio.gather(*(queue.run("sensor.product_a", lambda n=n: command(n)) for n in range(20)))
+
+    asyncio.run(run())
+    assert applied == list(range(20))
+
+
+def test_poll_snapshot_is_stale_while_a_command_is_in_flight():
+    queue = ProductCommandQueue()
+
+    async def run():
+        release = asyncio.Event()
+        snapshot = queue.snapshot()
+        task = asyncio.ensure_future(queue.run("sensor.product_a", release.wait))
+        await asyncio.sleep(0)
+        in_flight = queue.is_stale("sensor.product_a", snapshot)
+        release.set()
+        await task
+        fresh_snapshot = queue.snapshot()
+        return in_flight, queue.is_stale("sensor.product_a", fresh_snapshot), queue.is_stale("sensor.product_b", snapshot)
+
+    in_flight, after_fresh_poll, other_product = asyncio.run(run())
+    assert in_flight
+    assert not after_fresh_poll
+    assert not other_product
+
+
+def test_failed_commands_are_counted_and_raised():
+    queue = ProductCommandQueue()
+
+    async def fail():
+        raise RuntimeError("API down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(queue.run("sensor.product_a", fail))
+    assert queue.stats["failed"] == 1
+    assert queue.stats["commands"] == 1